@@ -3,9 +3,123 @@ Calculator Module
 A comprehensive calculator with basic operations, memory functions, and history tracking.
 """
 
-from typing import List, Optional, Union
-from datetime import datetime
-import json
+from collections import deque
+import functools
+import importlib.util
+import io
+import os
+import sys
+from typing import IO, Any, Deque, Iterable, List, Optional, Tuple, Union
+import time
+
+__all__ = ["Calculator"]
+
+
+# History entry templates, rendered by Calculator._format_entry when read
+_HISTORY_FMT = "[%s] %s"
+_BINARY_OP_FMT = "%s %s %s = %s"
+_MEMORY_UPDATE_FMT = "%s %s (Memory: %s)"
+_MEMORY_RECALL_FMT = "MR (Memory: %s)"
+_MEMORY_CLEAR_FMT = "MC (Memory cleared)"
+_BATCH_FMT = "Batch %s of %s pairs"
+_ARRAY_FMT = "Array %s of %s elements"
+
+
+def _coerce_operands(a: Any, b: Any, operation: str) -> Tuple[float, float]:
+    """
+    Convert two operands to floats.
+    
+    Plain ints and floats are converted directly; only other types (numeric
+    strings, Decimal, user-defined numbers) go through the guarded float() call.
+    
+    Args:
+        a: First operand
+        b: Second operand
+        operation: Operation name used in the error message
+        
+    Returns:
+        Tuple[float, float]: The converted operands
+        
+    Raises:
+        TypeError: If either operand cannot be converted to float
+        OverflowError: If an int operand is too large to convert to float
+    """
+    if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+        return float(a), float(b)
+    try:
+        return float(a), float(b)
+    except (TypeError, ValueError) as e:
+        raise TypeError(f"Invalid input types for {operation}: {type(a)}, {type(b)}") from e
+
+
+@functools.lru_cache(maxsize=64)
+def _format_timestamp(seconds: int) -> str:
+    """
+    Format a whole-second Unix timestamp as local time.
+    
+    Cached so entries recorded within the same second share one strftime call.
+    
+    Args:
+        seconds: Seconds since the epoch
+        
+    Returns:
+        str: Timestamp formatted as YYYY-MM-DD HH:MM:SS
+    """
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
+def _dumps_json(data: Any, pretty: bool) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise.
+    
+    Args:
+        data: JSON-serializable object
+        pretty: Indent the output by two spaces instead of writing it compactly
+        
+    Returns:
+        bytes: The encoded JSON document
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        # json.dumps uses the C encoder for compact output, unlike json.dump
+        if pretty:
+            return json.dumps(data, indent=2).encode()
+        return json.dumps(data, separators=(',', ':')).encode()
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+
+def _load_kernels() -> Any:
+    """
+    Import the numba kernels as the top-level calculator_kernels module.
+    
+    The kernels sit next to this module, which may itself be imported as
+    calculator.calculator from the repository root. numba's on-disk cache
+    records the module name the kernels were compiled under, so they are
+    always loaded under the one name.
+    
+    Returns:
+        module: The calculator_kernels module
+    """
+    module = sys.modules.get("calculator_kernels")
+    if module is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calculator_kernels.py")
+        spec = importlib.util.spec_from_file_location("calculator_kernels", path)
+        if spec is None or spec.loader is None or not os.path.isfile(path):
+            raise ModuleNotFoundError("Batch kernels not found at %s" % path,
+                                      name="calculator_kernels")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["calculator_kernels"] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules["calculator_kernels"]
+            raise
+    return module
 
 
 class Calculator:
@@ -15,21 +129,47 @@ class Calculator:
     
     Attributes:
         memory (float): The current value stored in memory
-        history (List[str]): List of recent calculations (max 5)
+        history (Deque[Tuple[float, str, Tuple[Any, ...]]]): Recent calculations as
+            (timestamp, template, args) records, rendered on read (max 5)
         max_history (int): Maximum number of calculations to store in history
+        record_history (bool): Whether operations are recorded in history
     """
     
-    def __init__(self, max_history: int = 5):
+    __slots__ = ('memory', 'history', 'record_history',
+                 '_last_result', '_has_last_result')
+    
+    def __init__(self, max_history: int = 5, record_history: bool = True):
         """
         Initialize the Calculator with empty memory and history.
         
         Args:
             max_history (int): Maximum number of calculations to store (default: 5)
+            record_history (bool): Record operations in history (default: True).
+                Disabling it skips building history entries entirely.
         """
         self.memory: float = 0.0
-        self.history: List[str] = []
-        self.max_history: int = max_history
-        self._last_result: Optional[float] = None
+        self.history: Deque[Tuple[float, str, Tuple[Any, ...]]] = deque(maxlen=max_history)
+        self.record_history: bool = record_history
+        # Kept as a plain float plus a flag rather than Optional[float] so
+        # mypyc can store it unboxed
+        self._last_result: float = 0.0
+        self._has_last_result: bool = False
+    
+    @property
+    def max_history(self) -> int:
+        """
+        Maximum number of calculations kept in history.
+        
+        Backed by the history deque's maxlen, so it cannot drift from the
+        limit actually enforced.
+        """
+        return self.history.maxlen or 0
+    
+    @max_history.setter
+    def max_history(self, value: int) -> None:
+        # A deque's maxlen is fixed, so changing the limit rebuilds it,
+        # keeping the most recent entries
+        self.history = deque(self.history, maxlen=value)
     
     # Basic Operations
     def add(self, a: Union[int, float], b: Union[int, float]) -> float:
@@ -45,17 +185,18 @@ class Calculator:
             
         Raises:
             TypeError: If inputs are not numeric
-            OverflowError: If result is too large
+            OverflowError: If an int operand is too large to convert to float
         """
-        try:
-            result = float(a) + float(b)
-            self._add_to_history(f"{a} + {b} = {result}")
-            self._last_result = result
-            return result
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid input types for addition: {type(a)}, {type(b)}") from e
-        except OverflowError as e:
-            raise OverflowError("Result too large to compute") from e
+        if type(a) is float and type(b) is float:
+            result = a + b
+        else:
+            a_float, b_float = _coerce_operands(a, b, "addition")
+            result = a_float + b_float
+        if self.record_history:
+            self._add_to_history(_BINARY_OP_FMT, a, "+", b, result)
+        self._last_result = result
+        self._has_last_result = True
+        return result
     
     def subtract(self, a: Union[int, float], b: Union[int, float]) -> float:
         """
@@ -70,14 +211,18 @@ class Calculator:
             
         Raises:
             TypeError: If inputs are not numeric
+            OverflowError: If an int operand is too large to convert to float
         """
-        try:
-            result = float(a) - float(b)
-            self._add_to_history(f"{a} - {b} = {result}")
-            self._last_result = result
-            return result
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid input types for subtraction: {type(a)}, {type(b)}") from e
+        if type(a) is float and type(b) is float:
+            result = a - b
+        else:
+            a_float, b_float = _coerce_operands(a, b, "subtraction")
+            result = a_float - b_float
+        if self.record_history:
+            self._add_to_history(_BINARY_OP_FMT, a, "-", b, result)
+        self._last_result = result
+        self._has_last_result = True
+        return result
     
     def multiply(self, a: Union[int, float], b: Union[int, float]) -> float:
         """
@@ -92,17 +237,18 @@ class Calculator:
             
         Raises:
             TypeError: If inputs are not numeric
-            OverflowError: If result is too large
+            OverflowError: If an int operand is too large to convert to float
         """
-        try:
-            result = float(a) * float(b)
-            self._add_to_history(f"{a} * {b} = {result}")
-            self._last_result = result
-            return result
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid input types for multiplication: {type(a)}, {type(b)}") from e
-        except OverflowError as e:
-            raise OverflowError("Result too large to compute") from e
+        if type(a) is float and type(b) is float:
+            result = a * b
+        else:
+            a_float, b_float = _coerce_operands(a, b, "multiplication")
+            result = a_float * b_float
+        if self.record_history:
+            self._add_to_history(_BINARY_OP_FMT, a, "*", b, result)
+        self._last_result = result
+        self._has_last_result = True
+        return result
     
     def divide(self, a: Union[int, float], b: Union[int, float]) -> float:
         """
@@ -117,17 +263,259 @@ class Calculator:
             
         Raises:
             TypeError: If inputs are not numeric
+            OverflowError: If an int operand is too large to convert to float
             ZeroDivisionError: If b is zero
         """
+        if type(a) is float and type(b) is float:
+            dividend, divisor = a, b
+        else:
+            dividend, divisor = _coerce_operands(a, b, "division")
+        if divisor == 0.0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        result = dividend / divisor
+        if self.record_history:
+            self._add_to_history(_BINARY_OP_FMT, a, "/", b, result)
+        self._last_result = result
+        self._has_last_result = True
+        return result
+    
+    # Batch Operations
+    def add_many(self, pairs: Iterable[Tuple[Union[int, float], Union[int, float]]]) -> List[float]:
+        """
+        Add each (a, b) pair, with the same results and history as calling add() in turn.
+        
+        Args:
+            pairs: Iterable of (a, b) number pairs
+            
+        Returns:
+            List[float]: Sum of each pair, in order
+            
+        Raises:
+            TypeError: If any input is not numeric. The pairs before it are
+                still recorded, as they would be by a loop of add() calls.
+            OverflowError: If an int operand is too large to convert to float
+        """
+        pairs = list(pairs)
+        results: List[float] = []
+        try:
+            for a, b in pairs:
+                a_float, b_float = _coerce_operands(a, b, "addition")
+                results.append(a_float + b_float)
+        finally:
+            if results:
+                if self.record_history:
+                    # Only the entries that would survive the history limit are recorded
+                    end = len(results)
+                    start = max(end - self.max_history, 0)
+                    self._record_many(_BINARY_OP_FMT, [(a, "+", b, result) for (a, b), result
+                                                       in zip(pairs[start:end], results[start:])])
+                self._last_result = results[-1]
+                self._has_last_result = True
+        return results
+    
+    def batch_add(self, xs: Any, ys: Any) -> Any:
+        """
+        Add two arrays of numbers element-wise.
+        
+        Args:
+            xs: First operands (1-D array-like)
+            ys: Second operands (1-D array-like, same length as xs)
+            
+        Returns:
+            numpy.ndarray: Element-wise sums as float64
+            
+        Raises:
+            ImportError: If numpy or numba is not installed
+            ValueError: If the operands are not 1-D arrays of equal length
+        """
+        return self._batch_op("add", xs, ys)
+    
+    def batch_subtract(self, xs: Any, ys: Any) -> Any:
+        """
+        Subtract two arrays of numbers element-wise.
+        
+        Args:
+            xs: Numbers to subtract from (1-D array-like)
+            ys: Numbers to subtract (1-D array-like, same length as xs)
+            
+        Returns:
+            numpy.ndarray: Element-wise differences as float64
+            
+        Raises:
+            ImportError: If numpy or numba is not installed
+            ValueError: If the operands are not 1-D arrays of equal length
+        """
+        return self._batch_op("subtract", xs, ys)
+    
+    def batch_multiply(self, xs: Any, ys: Any) -> Any:
+        """
+        Multiply two arrays of numbers element-wise.
+        
+        Args:
+            xs: First operands (1-D array-like)
+            ys: Second operands (1-D array-like, same length as xs)
+            
+        Returns:
+            numpy.ndarray: Element-wise products as float64
+            
+        Raises:
+            ImportError: If numpy or numba is not installed
+            ValueError: If the operands are not 1-D arrays of equal length
+        """
+        return self._batch_op("multiply", xs, ys)
+    
+    def batch_divide(self, xs: Any, ys: Any) -> Any:
+        """
+        Divide two arrays of numbers element-wise.
+        
+        Args:
+            xs: Dividends (1-D array-like)
+            ys: Divisors (1-D array-like, same length as xs)
+            
+        Returns:
+            numpy.ndarray: Element-wise quotients as float64
+            
+        Raises:
+            ImportError: If numpy or numba is not installed
+            ValueError: If the operands are not 1-D arrays of equal length
+            ZeroDivisionError: If any divisor is zero
+        """
+        return self._batch_op("divide", xs, ys)
+    
+    def _batch_op(self, operation: str, xs: Any, ys: Any) -> Any:
+        """
+        Run a numba batch kernel over two arrays.
+        
+        The whole batch is recorded as a single history entry.
+        
+        Args:
+            operation: Kernel name in calculator_kernels (add, subtract, multiply, divide)
+            xs: First operands
+            ys: Second operands
+            
+        Returns:
+            numpy.ndarray: Element-wise results as float64
+        """
+        try:
+            import numpy as np
+            import numba  # type: ignore  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Batch operations require numpy and numba") from e
+        # Imported outside the guard so a missing kernel module reports itself
+        kernels = _load_kernels()
+        
+        xs = np.ascontiguousarray(xs, dtype=np.float64)
+        ys = np.ascontiguousarray(ys, dtype=np.float64)
+        if xs.ndim != 1 or xs.shape != ys.shape:
+            raise ValueError("Batch operands must be 1-D arrays of equal length")
+        if operation == "divide" and not ys.all():
+            raise ZeroDivisionError("Cannot divide by zero")
+        
+        out = np.empty_like(xs)
+        getattr(kernels, operation)(xs, ys, out)
+        if self.record_history:
+            self._add_to_history(_BATCH_FMT, operation, len(out))
+        return out
+    
+    # Array Operations
+    def add_array(self, a: Any, b: Any, dtype: str = "float64") -> Any:
+        """
+        Add two arrays of numbers element-wise using numpy.
+        
+        Args:
+            a: First operands (array-like)
+            b: Second operands (array-like, broadcastable with a)
+            dtype: Result dtype; "float32" halves memory traffic at the cost of precision
+            
+        Returns:
+            numpy.ndarray: Element-wise sums
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        return self._array_op("add", a, b, dtype)
+    
+    def subtract_array(self, a: Any, b: Any, dtype: str = "float64") -> Any:
+        """
+        Subtract two arrays of numbers element-wise using numpy.
+        
+        Args:
+            a: Numbers to subtract from (array-like)
+            b: Numbers to subtract (array-like, broadcastable with a)
+            dtype: Result dtype; "float32" halves memory traffic at the cost of precision
+            
+        Returns:
+            numpy.ndarray: Element-wise differences
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        return self._array_op("subtract", a, b, dtype)
+    
+    def multiply_array(self, a: Any, b: Any, dtype: str = "float64") -> Any:
+        """
+        Multiply two arrays of numbers element-wise using numpy.
+        
+        Args:
+            a: First operands (array-like)
+            b: Second operands (array-like, broadcastable with a)
+            dtype: Result dtype; "float32" halves memory traffic at the cost of precision
+            
+        Returns:
+            numpy.ndarray: Element-wise products
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        return self._array_op("multiply", a, b, dtype)
+    
+    def divide_array(self, a: Any, b: Any, dtype: str = "float64") -> Any:
+        """
+        Divide two arrays of numbers element-wise using numpy.
+        
+        Args:
+            a: Dividends (array-like)
+            b: Divisors (array-like, broadcastable with a)
+            dtype: Result dtype; "float32" halves memory traffic at the cost of precision
+            
+        Returns:
+            numpy.ndarray: Element-wise quotients
+            
+        Raises:
+            ImportError: If numpy is not installed
+            ZeroDivisionError: If any divisor is zero
+        """
+        return self._array_op("divide", a, b, dtype)
+    
+    def _array_op(self, operation: str, a: Any, b: Any, dtype: str) -> Any:
+        """
+        Apply a numpy ufunc to two arrays.
+        
+        The whole array operation is recorded as a single history entry.
+        
+        Args:
+            operation: numpy ufunc name (add, subtract, multiply, divide)
+            a: First operands
+            b: Second operands
+            dtype: Result dtype
+            
+        Returns:
+            numpy.ndarray: Element-wise results
+        """
         try:
-            if float(b) == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            result = float(a) / float(b)
-            self._add_to_history(f"{a} / {b} = {result}")
-            self._last_result = result
-            return result
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid input types for division: {type(a)}, {type(b)}") from e
+            import numpy as np
+        except ImportError as e:
+            raise ImportError("Array operations require numpy") from e
+        
+        a = np.asarray(a, dtype=dtype)
+        b = np.asarray(b, dtype=dtype)
+        if operation == "divide" and not b.all():
+            raise ZeroDivisionError("Cannot divide by zero")
+        
+        result = getattr(np, operation)(a, b, dtype=dtype)
+        if self.record_history:
+            self._add_to_history(_ARRAY_FMT, operation, result.size)
+        return result
     
     # Memory Functions
     def memory_add(self, value: Optional[Union[int, float]] = None) -> None:
@@ -139,17 +527,9 @@ class Calculator:
             
         Raises:
             ValueError: If no value provided and no last result exists
+            TypeError: If value is not numeric
         """
-        if value is None:
-            if self._last_result is None:
-                raise ValueError("No value to add to memory")
-            value = self._last_result
-        
-        try:
-            self.memory += float(value)
-            self._add_to_history(f"M+ {value} (Memory: {self.memory})")
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid value for memory add: {value}") from e
+        self._memory_op(1, value)
     
     def memory_subtract(self, value: Optional[Union[int, float]] = None) -> None:
         """
@@ -160,17 +540,39 @@ class Calculator:
             
         Raises:
             ValueError: If no value provided and no last result exists
+            TypeError: If value is not numeric
+        """
+        self._memory_op(-1, value)
+    
+    def _memory_op(self, sign: int, value: Optional[Union[int, float]]) -> None:
+        """
+        Shared implementation of M+ and M-.
+        
+        Args:
+            sign: 1 to add the value to memory, -1 to subtract it
+            value: Value to apply. If None, uses last result.
+            
+        Raises:
+            ValueError: If no value provided and no last result exists
+            TypeError: If value is not numeric
         """
         if value is None:
-            if self._last_result is None:
-                raise ValueError("No value to subtract from memory")
+            if not self._has_last_result:
+                raise ValueError("No value to add to memory" if sign > 0
+                                 else "No value to subtract from memory")
             value = self._last_result
         
-        try:
-            self.memory -= float(value)
-            self._add_to_history(f"M- {value} (Memory: {self.memory})")
-        except (TypeError, ValueError) as e:
-            raise TypeError(f"Invalid value for memory subtract: {value}") from e
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            self.memory += sign * value
+        else:
+            try:
+                self.memory += sign * float(value)
+            except (TypeError, ValueError) as e:
+                operation = "add" if sign > 0 else "subtract"
+                raise TypeError(f"Invalid value for memory {operation}: {value}") from e
+        if self.record_history:
+            self._add_to_history(_MEMORY_UPDATE_FMT, "M+" if sign > 0 else "M-", value, self.memory)
     
     def memory_recall(self) -> float:
         """
@@ -179,7 +581,8 @@ class Calculator:
         Returns:
             float: Current memory value
         """
-        self._add_to_history(f"MR (Memory: {self.memory})")
+        if self.record_history:
+            self._add_to_history(_MEMORY_RECALL_FMT, self.memory)
         return self.memory
     
     def memory_clear(self) -> None:
@@ -187,24 +590,60 @@ class Calculator:
         Clear the memory (MC).
         """
         self.memory = 0.0
-        self._add_to_history("MC (Memory cleared)")
+        if self.record_history:
+            self._add_to_history(_MEMORY_CLEAR_FMT)
+    
+    def reset(self) -> None:
+        """
+        Reset the calculator to its initial state (AC).
+        
+        Clears memory, history and the last result without recording or
+        printing anything.
+        """
+        self.memory = 0.0
+        self.history.clear()
+        self._last_result = 0.0
+        self._has_last_result = False
     
     # History Functions
-    def _add_to_history(self, entry: str) -> None:
+    def _add_to_history(self, template: str, *args: Any) -> None:
         """
         Add an entry to the calculation history.
         
+        The timestamp, %-style template and its arguments are stored as-is;
+        the entry text is only rendered when the history is read.
+        
         Args:
-            entry: String representation of the calculation
+            template: %-style format string describing the calculation
+            *args: Values substituted into the template
+        """
+        # The deque's maxlen evicts the oldest entry once max_history is reached
+        self.history.append((time.time(), template, args))
+    
+    def _record_many(self, template: str, args_list: List[Tuple[Any, ...]]) -> None:
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        timestamped_entry = f"[{timestamp}] {entry}"
+        Add several entries sharing one template and timestamp to the history.
         
-        self.history.append(timestamped_entry)
+        Args:
+            template: %-style format string describing each calculation
+            args_list: Values substituted into the template, one tuple per entry
+        """
+        now = time.time()
+        self.history.extend([(now, template, args) for args in args_list])
+    
+    @staticmethod
+    def _format_entry(item: Tuple[float, str, Tuple[Any, ...]]) -> str:
+        """
+        Render a stored history entry with its timestamp.
         
-        # Keep only the last max_history entries
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history:]
+        Args:
+            item: (timestamp, template, args) record as stored in history
+            
+        Returns:
+            str: Entry prefixed with a [YYYY-MM-DD HH:MM:SS] timestamp
+        """
+        timestamp, template, args = item
+        return _HISTORY_FMT % (_format_timestamp(int(timestamp)), template % args)
     
     def get_history(self) -> List[str]:
         """
@@ -213,13 +652,14 @@ class Calculator:
         Returns:
             List[str]: List of recent calculations with timestamps
         """
-        return self.history.copy()
+        format_entry = self._format_entry
+        return [format_entry(item) for item in self.history]
     
     def clear_history(self) -> None:
         """
         Clear the calculation history.
         """
-        self.history = []
+        self.history.clear()
         print("History cleared")
     
     def display_history(self) -> None:
@@ -233,27 +673,43 @@ class Calculator:
         print("\n" + "="*50)
         print("CALCULATION HISTORY")
         print("="*50)
-        for i, entry in enumerate(self.history, 1):
+        for i, entry in enumerate(self.get_history(), 1):
             print(f"{i}. {entry}")
         print("="*50 + "\n")
     
-    def export_history(self, filename: str = "history.json") -> bool:
+    def export_history(self, filename: Union[str, IO[Any]] = "history.json",
+                       pretty: bool = False) -> bool:
         """
         Export calculation history to a JSON file.
         
         Args:
-            filename: Name of the file to export to
+            filename: Name of the file to export to, or an open file-like
+                object (e.g. io.StringIO or io.BytesIO) to write the JSON to directly
+            pretty: Indent the JSON for readability (default: compact output)
             
         Returns:
             bool: True if export successful, False otherwise
         """
+        # Only needed on this cold path, so not imported at module load
+        from datetime import datetime
+        
+        data = {
+            "export_time": datetime.now().isoformat(),
+            "calculations": self.get_history()
+        }
         try:
-            with open(filename, 'w') as f:
-                json.dump({
-                    "export_time": datetime.now().isoformat(),
-                    "calculations": self.history
-                }, f, indent=2)
-            print(f"History exported to {filename}")
+            payload = _dumps_json(data, pretty)
+            if hasattr(filename, "write"):
+                # Only streams known to be binary get bytes; any other writer is text
+                if (isinstance(filename, (io.RawIOBase, io.BufferedIOBase))
+                        or 'b' in getattr(filename, "mode", "")):
+                    filename.write(payload)
+                else:
+                    filename.write(payload.decode())
+            else:
+                with open(filename, 'wb') as f:
+                    f.write(payload)
+                print(f"History exported to {filename}")
             return True
         except Exception as e:
             print(f"Error exporting history: {e}")
@@ -274,6 +730,13 @@ def main():
     """
     Main function to run the calculator in interactive mode.
     """
+    try:
+        # Drop-in replacement for the builtin float() with faster string parsing.
+        # Imported here rather than at module load because it pulls in numpy.
+        from fastnumbers import float as parse_float  # type: ignore
+    except ImportError:
+        parse_float = float  # type: ignore
+    
     calc = Calculator()
     
     print("\n" + "="*50)
@@ -286,11 +749,27 @@ def main():
     print("  Other: help, quit")
     print("\n" + "="*50 + "\n")
     
+    operations = {
+        "add": calc.add,
+        "sub": calc.subtract,
+        "mul": calc.multiply,
+        "div": calc.divide,
+    }
+    
     while True:
         try:
             command = input("Enter command (or 'help'): ").strip().lower()
+            parts = command.split()
+            operation = operations.get(parts[0]) if parts else None
+            
+            if operation is not None:
+                if len(parts) != 3:
+                    print(f"Usage: {parts[0]} <number1> <number2>")
+                    continue
+                result = operation(parse_float(parts[1]), parse_float(parts[2]))
+                print(f"Result: {result}")
             
-            if command == 'quit':
+            elif command == 'quit':
                 print("Thank you for using the calculator!")
                 break
             
@@ -309,50 +788,16 @@ def main():
                 print("  export - Export history to file")
                 print("  quit - Exit calculator\n")
             
-            elif command.startswith('add'):
-                parts = command.split()
-                if len(parts) != 3:
-                    print("Usage: add <number1> <number2>")
-                    continue
-                result = calc.add(float(parts[1]), float(parts[2]))
-                print(f"Result: {result}")
-            
-            elif command.startswith('sub'):
-                parts = command.split()
-                if len(parts) != 3:
-                    print("Usage: sub <number1> <number2>")
-                    continue
-                result = calc.subtract(float(parts[1]), float(parts[2]))
-                print(f"Result: {result}")
-            
-            elif command.startswith('mul'):
-                parts = command.split()
-                if len(parts) != 3:
-                    print("Usage: mul <number1> <number2>")
-                    continue
-                result = calc.multiply(float(parts[1]), float(parts[2]))
-                print(f"Result: {result}")
-            
-            elif command.startswith('div'):
-                parts = command.split()
-                if len(parts) != 3:
-                    print("Usage: div <number1> <number2>")
-                    continue
-                result = calc.divide(float(parts[1]), float(parts[2]))
-                print(f"Result: {result}")
-            
             elif command.startswith('m+'):
-                parts = command.split()
                 if len(parts) > 1:
-                    calc.memory_add(float(parts[1]))
+                    calc.memory_add(parse_float(parts[1]))
                 else:
                     calc.memory_add()
                 print(f"Memory: {calc.get_memory_value()}")
             
             elif command.startswith('m-'):
-                parts = command.split()
                 if len(parts) > 1:
-                    calc.memory_subtract(float(parts[1]))
+                    calc.memory_subtract(parse_float(parts[1]))
                 else:
                     calc.memory_subtract()
                 print(f"Memory: {calc.get_memory_value()}")
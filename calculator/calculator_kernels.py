@@ -0,0 +1,37 @@
+"""
+Calculator Kernels Module
+Numba-compiled loops backing the Calculator batch operations.
+
+This module requires numpy and numba and is only imported when a batch
+operation is first used.
+"""
+
+from numba import njit, prange  # type: ignore
+
+
+@njit(cache=True, parallel=True)
+def add(xs, ys, out):
+    """Write xs[i] + ys[i] into out[i] for every element."""
+    for i in prange(xs.shape[0]):
+        out[i] = xs[i] + ys[i]
+
+
+@njit(cache=True, parallel=True)
+def subtract(xs, ys, out):
+    """Write xs[i] - ys[i] into out[i] for every element."""
+    for i in prange(xs.shape[0]):
+        out[i] = xs[i] - ys[i]
+
+
+@njit(cache=True, parallel=True)
+def multiply(xs, ys, out):
+    """Write xs[i] * ys[i] into out[i] for every element."""
+    for i in prange(xs.shape[0]):
+        out[i] = xs[i] * ys[i]
+
+
+@njit(cache=True, parallel=True)
+def divide(xs, ys, out):
+    """Write xs[i] / ys[i] into out[i] for every element."""
+    for i in prange(xs.shape[0]):
+        out[i] = xs[i] / ys[i]
@@ -0,0 +1,23 @@
+"""
+Build script for the calculator module.
+
+When mypyc is installed the module is compiled to a C extension
+(pip install mypy, then python setup.py build_ext --inplace); otherwise
+it installs as plain Python.
+"""
+
+from setuptools import setup
+
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = mypycify(["calculator.py"])
+
+setup(
+    name="calculator",
+    version="1.0.0",
+    py_modules=["calculator", "calculator_kernels"],
+    ext_modules=ext_modules,
+)
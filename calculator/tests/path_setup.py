@@ -0,0 +1,11 @@
+"""
+Shared test setup that puts the calculator directory on sys.path.
+
+Imported by each test module, so the tests run under pytest, under
+unittest discovery and as plain scripts alike.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -3,19 +3,26 @@ Unit tests for Calculator basic operations.
 """
 
 import unittest
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import importlib.util
 
+import path_setup  # noqa: F401  (puts the calculator directory on sys.path)
 from calculator import Calculator
 
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
 
 class TestCalculatorBasicOperations(unittest.TestCase):
     """Test suite for basic calculator operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
     def setUp(self):
-        """Set up a fresh calculator instance for each test."""
-        self.calc = Calculator()
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
     
     # Addition Tests
     def test_add_positive_numbers(self):
@@ -105,6 +112,12 @@ class TestCalculatorBasicOperations(unittest.TestCase):
         result = self.calc.multiply(42, 1)
         self.assertEqual(result, 42)
     
+    def test_multiply_preserves_signed_zero(self):
+        """Test that -0.0 results keep their sign after a 0.0 result."""
+        self.assertEqual(str(self.calc.multiply(0.0, 5.0)), "0.0")
+        self.assertEqual(str(self.calc.multiply(-0.0, 5.0)), "-0.0")
+        self.assertEqual(str(self.calc.add(-0.0, -0.0)), "-0.0")
+    
     # Division Tests
     def test_divide_positive_numbers(self):
         """Test dividing positive numbers."""
@@ -146,6 +159,34 @@ class TestCalculatorBasicOperations(unittest.TestCase):
         result = self.calc.divide(0, 5)
         self.assertEqual(result, 0)
     
+    # Bulk Addition Tests
+    def test_add_many(self):
+        """Test adding a sequence of pairs in one call."""
+        results = self.calc.add_many([(1, 2), (3.5, 0.5), (-4, 4)])
+        self.assertEqual(results, [3, 4, 0])
+        history = self.calc.get_history()
+        self.assertEqual(len(history), 3)
+        self.assertIn("3.5 + 0.5 = 4.0", history[1])
+        # The last sum becomes the result used by memory_add()
+        self.calc.memory_add()
+        self.assertEqual(self.calc.get_memory_value(), 0)
+    
+    def test_add_many_empty(self):
+        """Test that an empty sequence records nothing."""
+        self.assertEqual(self.calc.add_many([]), [])
+        self.assertEqual(len(self.calc.get_history()), 0)
+    
+    def test_add_many_invalid_input_type(self):
+        """Test that add_many rejects non-numeric input."""
+        with self.assertRaises(TypeError):
+            self.calc.add_many([(1, 2), ("five", 3)])
+        # Like a loop of add() calls, the pairs before the bad one are kept
+        history = self.calc.get_history()
+        self.assertEqual(len(history), 1)
+        self.assertIn("1 + 2 = 3", history[0])
+        self.calc.memory_add()
+        self.assertEqual(self.calc.get_memory_value(), 3)
+    
     # Type Error Tests
     def test_add_invalid_input_type(self):
         """Test adding with invalid input types."""
@@ -167,6 +208,14 @@ class TestCalculatorBasicOperations(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.calc.divide(10, "two")
     
+    def test_int_too_large_for_float(self):
+        """Test that an int operand too large for a float raises OverflowError."""
+        huge = 10 ** 400
+        for operation in (self.calc.add, self.calc.subtract,
+                          self.calc.multiply, self.calc.divide):
+            with self.assertRaises(OverflowError):
+                operation(huge, 1)
+    
     # Edge Cases
     def test_add_very_small_numbers(self):
         """Test adding very small numbers."""
@@ -206,9 +255,14 @@ class TestCalculatorBasicOperations(unittest.TestCase):
 class TestCalculatorChainOperations(unittest.TestCase):
     """Test suite for chaining calculator operations."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
     def setUp(self):
-        """Set up a fresh calculator instance for each test."""
-        self.calc = Calculator()
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
     
     def test_chain_multiple_operations(self):
         """Test performing multiple operations in sequence."""
@@ -226,5 +280,85 @@ class TestCalculatorChainOperations(unittest.TestCase):
         self.assertEqual(memory_value, 10)
 
 
+@unittest.skipUnless(HAS_NUMBA, "numba is not installed")
+class TestCalculatorBatchOperations(unittest.TestCase):
+    """Test suite for numba-backed batch operations."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
+    def setUp(self):
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
+    
+    def test_batch_add(self):
+        """Test adding arrays element-wise."""
+        result = self.calc.batch_add([1, 2, 3], [4, 5, 6])
+        self.assertEqual(list(result), [5.0, 7.0, 9.0])
+    
+    def test_batch_subtract_multiply_divide(self):
+        """Test the remaining batch operations."""
+        self.assertEqual(list(self.calc.batch_subtract([5, 3], [1, 4])), [4.0, -1.0])
+        self.assertEqual(list(self.calc.batch_multiply([2, 3], [4, 5])), [8.0, 15.0])
+        self.assertEqual(list(self.calc.batch_divide([8, 9], [2, 3])), [4.0, 3.0])
+    
+    def test_batch_divide_by_zero_error(self):
+        """Test that a zero divisor raises ZeroDivisionError."""
+        with self.assertRaises(ZeroDivisionError):
+            self.calc.batch_divide([1, 2], [1, 0])
+    
+    def test_batch_mismatched_lengths(self):
+        """Test that operands of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            self.calc.batch_add([1, 2, 3], [1, 2])
+    
+    def test_batch_adds_single_history_entry(self):
+        """Test that a batch is recorded as one history entry."""
+        self.calc.batch_add([1, 2, 3], [4, 5, 6])
+        history = self.calc.get_history()
+        self.assertEqual(len(history), 1)
+        self.assertIn("Batch add of 3 pairs", history[0])
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+class TestCalculatorArrayOperations(unittest.TestCase):
+    """Test suite for numpy-backed array operations."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
+    def setUp(self):
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
+    
+    def test_array_operations(self):
+        """Test all four element-wise array operations."""
+        self.assertEqual(list(self.calc.add_array([1, 2], [3, 4])), [4.0, 6.0])
+        self.assertEqual(list(self.calc.subtract_array([5, 3], [1, 4])), [4.0, -1.0])
+        self.assertEqual(list(self.calc.multiply_array([2, 3], [4, 5])), [8.0, 15.0])
+        self.assertEqual(list(self.calc.divide_array([8, 9], [2, 3])), [4.0, 3.0])
+    
+    def test_array_float32_dtype(self):
+        """Test that the dtype argument controls the result precision."""
+        result = self.calc.add_array([1.5, 2.5], [1, 1], dtype="float32")
+        self.assertEqual(result.dtype.name, "float32")
+    
+    def test_divide_array_by_zero_error(self):
+        """Test that a zero divisor raises ZeroDivisionError."""
+        with self.assertRaises(ZeroDivisionError):
+            self.calc.divide_array([1, 2], [1, 0])
+    
+    def test_array_adds_single_history_entry(self):
+        """Test that an array operation is recorded as one history entry."""
+        self.calc.multiply_array([1, 2, 3, 4], 2)
+        history = self.calc.get_history()
+        self.assertEqual(len(history), 1)
+        self.assertIn("Array multiply of 4 elements", history[0])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,23 +3,30 @@ Unit tests for Calculator memory functions and history features.
 """
 
 import unittest
-import sys
+import io
+import math
 import os
 import json
 import tempfile
 from datetime import datetime
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
+import path_setup  # noqa: F401  (puts the calculator directory on sys.path)
 from calculator import Calculator
 
+_CURRENT_YEAR = str(datetime.now().year)
+
 
 class TestCalculatorMemoryFunctions(unittest.TestCase):
     """Test suite for calculator memory functions."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
     def setUp(self):
-        """Set up a fresh calculator instance for each test."""
-        self.calc = Calculator()
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
     
     def test_initial_memory_is_zero(self):
         """Test that memory starts at zero."""
@@ -41,7 +48,7 @@ class TestCalculatorMemoryFunctions(unittest.TestCase):
         """Test adding decimal values to memory."""
         self.calc.memory_add(3.5)
         self.calc.memory_add(2.7)
-        self.assertAlmostEqual(self.calc.get_memory_value(), 6.2, places=7)
+        self.assertTrue(math.isclose(self.calc.get_memory_value(), 6.2, rel_tol=0, abs_tol=5e-8))
     
     def test_memory_add_without_value_uses_last_result(self):
         """Test that memory_add without value uses last calculation result."""
@@ -116,6 +123,17 @@ class TestCalculatorMemoryFunctions(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.calc.memory_subtract("five")
     
+    def test_reset_clears_state(self):
+        """Test that reset clears memory, history and the last result."""
+        self.calc.add(10, 5)
+        self.calc.memory_add()
+        self.calc.reset()
+        
+        self.assertEqual(self.calc.get_memory_value(), 0.0)
+        self.assertEqual(len(self.calc.get_history()), 0)
+        with self.assertRaises(ValueError):
+            self.calc.memory_add()
+    
     def test_complex_memory_sequence(self):
         """Test a complex sequence of memory operations."""
         # Start with some calculations
@@ -135,9 +153,14 @@ class TestCalculatorMemoryFunctions(unittest.TestCase):
 class TestCalculatorHistory(unittest.TestCase):
     """Test suite for calculator history features."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator(max_history=5)
+    
     def setUp(self):
-        """Set up a fresh calculator instance for each test."""
-        self.calc = Calculator(max_history=5)
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
     
     def test_initial_history_empty(self):
         """Test that history starts empty."""
@@ -163,8 +186,7 @@ class TestCalculatorHistory(unittest.TestCase):
         self.assertIn("[", history[0])
         self.assertIn("]", history[0])
         # Check that the current year is in the timestamp
-        current_year = str(datetime.now().year)
-        self.assertIn(current_year, history[0])
+        self.assertIn(_CURRENT_YEAR, history[0])
     
     def test_history_max_limit(self):
         """Test that history respects maximum limit."""
@@ -178,6 +200,15 @@ class TestCalculatorHistory(unittest.TestCase):
         self.assertIn("5 + 1 = 6", history[0])
         self.assertIn("9 + 1 = 10", history[4])
     
+    def test_add_many_history_limit(self):
+        """Test that add_many keeps only the last max_history entries."""
+        self.calc.add_many([(i, 1) for i in range(10)])
+        
+        history = self.calc.get_history()
+        self.assertEqual(len(history), 5)
+        self.assertIn("5 + 1 = 6", history[0])
+        self.assertIn("9 + 1 = 10", history[4])
+    
     def test_clear_history(self):
         """Test clearing history."""
         self.calc.add(5, 3)
@@ -213,28 +244,90 @@ class TestCalculatorHistory(unittest.TestCase):
             
         finally:
             # Clean up temp file
-            import os
-            if os.path.exists(temp_filename):
+            try:
                 os.remove(temp_filename)
+            except FileNotFoundError:
+                pass
+    
+    def test_history_export_to_stream(self):
+        """Test exporting history to a file-like object."""
+        self.calc.add(10, 5)
+        self.calc.multiply(3, 4)
+        
+        buf = io.StringIO()
+        success = self.calc.export_history(buf)
+        self.assertTrue(success)
+        
+        data = json.loads(buf.getvalue())
+        self.assertIn('export_time', data)
+        self.assertEqual(len(data['calculations']), 2)
+        self.assertIn("10 + 5 = 15", data['calculations'][0])
     
     def test_export_history_empty(self):
         """Test exporting empty history."""
+        buf = io.StringIO()
+        success = self.calc.export_history(buf)
+        self.assertTrue(success)
+        
+        data = json.loads(buf.getvalue())
+        self.assertEqual(len(data['calculations']), 0)
+    
+    def test_export_history_to_text_writers(self):
+        """Test exporting to text writers that are not io.TextIOBase subclasses."""
+        self.calc.add(1, 2)
+        
+        class TextWriter:
+            def __init__(self):
+                self.chunks = []
+            
+            def write(self, text):
+                if not isinstance(text, str):
+                    raise TypeError("text writer expects str")
+                self.chunks.append(text)
+        
+        writer = TextWriter()
+        self.assertTrue(self.calc.export_history(writer))
+        self.assertEqual(len(json.loads(''.join(writer.chunks))['calculations']), 1)
+        
+        with tempfile.NamedTemporaryFile('w+') as f:
+            self.assertTrue(self.calc.export_history(f))
+            f.seek(0)
+            self.assertEqual(len(json.load(f)['calculations']), 1)
+    
+    def test_export_history_to_binary_stream(self):
+        """Test exporting to binary streams."""
+        self.calc.add(1, 2)
+        buf = io.BytesIO()
+        self.assertTrue(self.calc.export_history(buf))
+        self.assertEqual(len(json.loads(buf.getvalue())['calculations']), 1)
+        
+        with tempfile.NamedTemporaryFile('w+b') as f:
+            self.assertTrue(self.calc.export_history(f))
+            f.seek(0)
+            self.assertEqual(len(json.load(f)['calculations']), 1)
+    
+    def test_export_history_pretty(self):
+        """Test that exports are compact by default and indented when pretty."""
+        self.calc.add(1, 2)
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
             temp_filename = f.name
         
         try:
-            success = self.calc.export_history(temp_filename)
-            self.assertTrue(success)
-            
+            self.calc.export_history(temp_filename)
             with open(temp_filename, 'r') as f:
-                data = json.load(f)
+                self.assertNotIn('\n', f.read())
             
-            self.assertEqual(len(data['calculations']), 0)
+            self.calc.export_history(temp_filename, pretty=True)
+            with open(temp_filename, 'r') as f:
+                content = f.read()
+            self.assertIn('\n  "calculations"', content)
+            self.assertEqual(len(json.loads(content)['calculations']), 1)
             
         finally:
-            import os
-            if os.path.exists(temp_filename):
+            try:
                 os.remove(temp_filename)
+            except FileNotFoundError:
+                pass
     
     def test_get_history_returns_copy(self):
         """Test that get_history returns a copy, not the original list."""
@@ -254,6 +347,38 @@ class TestCalculatorHistory(unittest.TestCase):
         history = calc.get_history()
         self.assertEqual(len(history), 3)
     
+    def test_change_max_history(self):
+        """Test that assigning max_history changes the history limit."""
+        calc = Calculator(max_history=3)
+        for i in range(3):
+            calc.add(i, 1)
+        
+        calc.max_history = 1
+        self.assertEqual(calc.max_history, 1)
+        history = calc.get_history()
+        self.assertEqual(len(history), 1)
+        self.assertIn("2 + 1 = 3", history[0])
+        
+        calc.add(5, 5)
+        history = calc.get_history()
+        self.assertEqual(len(history), 1)
+        self.assertIn("5 + 5 = 10", history[0])
+        
+        calc.max_history = 4
+        for i in range(5):
+            calc.add(i, 1)
+        self.assertEqual(len(calc.get_history()), 4)
+    
+    def test_history_disabled(self):
+        """Test that no history is recorded when record_history is False."""
+        calc = Calculator(record_history=False)
+        self.assertEqual(calc.add(5, 3), 8)
+        calc.memory_add()
+        calc.memory_recall()
+        
+        self.assertEqual(len(calc.get_history()), 0)
+        self.assertEqual(calc.get_memory_value(), 8)
+    
     def test_history_with_all_operation_types(self):
         """Test that all operation types are properly recorded in history."""
         self.calc.add(10, 5)
@@ -276,9 +401,14 @@ class TestCalculatorHistory(unittest.TestCase):
 class TestCalculatorIntegration(unittest.TestCase):
     """Integration tests for calculator functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one calculator instance shared by the tests in this class."""
+        cls.calc = Calculator()
+    
     def setUp(self):
-        """Set up a fresh calculator instance for each test."""
-        self.calc = Calculator()
+        """Reset the shared calculator before each test."""
+        self.calc.reset()
     
     def test_calculation_memory_history_integration(self):
         """Test integration of calculations, memory, and history."""
@@ -325,11 +455,11 @@ class TestCalculatorIntegration(unittest.TestCase):
         self.calc.memory_add()
         
         result = self.calc.multiply(0.3, 3)
-        self.assertAlmostEqual(result, 0.9, places=10)
+        self.assertTrue(math.isclose(result, 0.9, rel_tol=0, abs_tol=5e-11))
         
         # Memory should maintain precision
         memory = self.calc.get_memory_value()
-        self.assertAlmostEqual(memory, 0.3, places=10)
+        self.assertTrue(math.isclose(memory, 0.3, rel_tol=0, abs_tol=5e-11))
 
 
 if __name__ == '__main__':